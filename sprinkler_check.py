@@ -3,6 +3,7 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "requests",
+#     "orjson",
 # ]
 # ///
 """
@@ -11,19 +12,30 @@ Checks recent precipitation and sends email summary for sprinkler decisions
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import atexit
+from email.message import EmailMessage
 from datetime import datetime, timedelta
+from collections import defaultdict
 import tomllib
+import json
 from pathlib import Path
 import time
-from functools import wraps
+from functools import cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 # ============ CONFIGURATION ============
 
+@cache
 def load_config():
-    """Load configuration from config.toml"""
+    """Load configuration from config.toml (read once per process)"""
     config_path = Path(__file__).parent / "config.toml"
 
     if not config_path.exists():
@@ -37,6 +49,33 @@ def load_config():
 
 # ============ SCRIPT ============
 
+# NWS grid assignments for a location change on the scale of years, so the
+# /points response is cached on disk and refreshed weekly
+CACHE_DIR = Path.home() / ".cache" / "sprinkler_check"
+POINTS_CACHE_TTL = 7 * 86400  # seconds
+
+# Result of the last successful run, used to skip reruns once rain is sufficient
+STATE_PATH = CACHE_DIR / "state.json"
+
+# Weekday abbreviations indexed by date.weekday(), used instead of strftime('%a')
+WEEKDAY = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+# Shared HTTP session so all NWS calls reuse one pooled keep-alive connection.
+# Transient NWS errors (429/5xx) are retried quickly in-process with exponential
+# backoff before falling back to the slower retry_nws_call() attempts.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "stu@stu.systems"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+
 def retry_nws_call(max_attempts=3, delays=(300, 600)):
     """
     Retry decorator for NWS API calls
@@ -67,21 +106,43 @@ def retry_nws_call(max_attempts=3, delays=(300, 600)):
 
 
 @retry_nws_call()
-def get_nws_observation_station(lat, lon):
-    """Get the nearest NWS observation station for given coordinates"""
+def get_points(lat, lon):
+    """Get the NWS points metadata (station and forecast URLs) for given coordinates"""
     points_url = f"https://api.weather.gov/points/{lat},{lon}"
-    headers = {"User-Agent": "stu@stu.systems"}
+    cache_path = CACHE_DIR / f"points_{lat}_{lon}.json"
+
+    # Use the cached response if it is still fresh
+    try:
+        if cache_path.stat().st_mtime > time.time() - POINTS_CACHE_TTL:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache, fall through to a fresh fetch
+        pass
 
     try:
-        response = requests.get(points_url, headers=headers, timeout=10)
+        response = SESSION.get(points_url, timeout=10)
         response.raise_for_status()
         data = response.json()
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Error fetching NWS points: {e}")
 
-        # Get observation stations URL
-        stations_url = data['properties']['observationStations']
+    # A failed cache write shouldn't fail the run
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"Warning: could not cache NWS points data: {e}")
 
-        # Fetch the nearest station
-        stations_response = requests.get(stations_url, headers=headers, timeout=10)
+    return data
+
+
+@retry_nws_call()
+def get_nws_observation_station(stations_url):
+    """Get the nearest NWS observation station from the points stations URL"""
+    try:
+        stations_response = SESSION.get(stations_url, timeout=10)
         stations_response.raise_for_status()
         stations_data = stations_response.json()
 
@@ -96,152 +157,142 @@ def get_nws_observation_station(lat, lon):
 
 
 @retry_nws_call()
-def get_precipitation_data(station_id, hours=12):
-    """Fetch precipitation observations from NWS station"""
+def get_observations(station_id):
+    """Fetch recent observations (newest first) from NWS station"""
     observations_url = f"https://api.weather.gov/stations/{station_id}/observations"
-    headers = {"User-Agent": "stu@stu.systems"}
 
     try:
-        response = requests.get(observations_url, headers=headers, timeout=10)
+        response = SESSION.get(observations_url, timeout=10)
         response.raise_for_status()
-        data = response.json()
-
-        observations = data['features']
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        seven_days_ago = datetime.now() - timedelta(days=7)
-
-        total_precip_mm = 0
-        observation_count = 0
-        latest_observation = None
-
-        # Dictionary to store daily totals: date -> precip_mm
-        daily_totals = {}
-
-        for obs in observations:
-            obs_time_str = obs['properties']['timestamp']
-            obs_time = datetime.fromisoformat(obs_time_str.replace('Z', '+00:00'))
-
-            # Stop if we've gone back more than 7 days
-            if obs_time < seven_days_ago.astimezone():
-                break
-
-            if not latest_observation:
-                latest_observation = obs_time
-
-            # Get precipitation (last hour)
-            precip = obs['properties'].get('precipitationLastHour', {})
-            if precip and precip.get('value') is not None:
-                precip_mm = precip['value']
-
-                # Add to recent total if within the specified hours
-                if obs_time >= cutoff_time.astimezone():
-                    total_precip_mm += precip_mm
-                    observation_count += 1
-
-                # Add to daily totals
-                obs_date = obs_time.date()
-                if obs_date not in daily_totals:
-                    daily_totals[obs_date] = 0
-                daily_totals[obs_date] += precip_mm
-
-        # Convert mm to inches
-        total_precip_inches = total_precip_mm / 25.4
-
-        # Convert daily totals to inches and format
-        daily_totals_inches = {
-            date: round(mm / 25.4, 2)
-            for date, mm in sorted(daily_totals.items(), reverse=True)
-        }
-
-        return {
-            'total_mm': round(total_precip_mm, 2),
-            'total_inches': round(total_precip_inches, 2),
-            'observation_count': observation_count,
-            'latest_observation': latest_observation,
-            'station_id': station_id,
-            'daily_totals': daily_totals_inches
-        }
+        # The observations payload is the largest one, so parse it with orjson when available
+        data = orjson.loads(response.content) if orjson else response.json()
+        return data['features']
 
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Error fetching precipitation data: {e}")
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError covers orjson.JSONDecodeError, which isn't a RequestException
+        raise Exception(f"Error fetching observations: {e}")
 
 
-@retry_nws_call()
-def get_pressure_data(station_id):
-    """Fetch barometric pressure observations from NWS station"""
-    observations_url = f"https://api.weather.gov/stations/{station_id}/observations"
-    headers = {"User-Agent": "SprinklerCheckScript/1.0"}
+def _unpack_features(features):
+    """
+    Yield (precipitation, pressure) values per observation feature, None if missing
 
-    try:
-        response = requests.get(observations_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+    Lazy, so the parsers' early breaks skip unpacking the rest of the week.
+    """
+    for o in features:
+        props = o['properties']
+        precip = props.get('precipitationLastHour')
+        pressure = props.get('barometricPressure')
+        yield (
+            precip.get('value') if precip else None,
+            pressure.get('value') if pressure else None,
+        )
 
-        observations = data['features']
-        now = datetime.now()
-        yesterday = now - timedelta(days=1)
-
-        current_pressure = None
-        yesterday_pressure = None
-        current_time = None
-        yesterday_time = None
-
-        for obs in observations:
-            obs_time_str = obs['properties']['timestamp']
-            obs_time = datetime.fromisoformat(obs_time_str.replace('Z', '+00:00'))
-
-            # Get barometric pressure
-            pressure = obs['properties'].get('barometricPressure', {})
-            if pressure and pressure.get('value') is not None:
-                pressure_pa = pressure['value']
-                # Convert Pascals to hectopascals (1 hPa = 100 Pa)
-                pressure_hpa = pressure_pa / 100
-
-                # Get most recent pressure (current)
-                if current_pressure is None:
-                    current_pressure = pressure_hpa
-                    current_time = obs_time
-
-                # Get pressure from approximately 24 hours ago
-                time_diff = abs((obs_time - yesterday.astimezone()).total_seconds())
-                if time_diff < 3600:  # Within 1 hour of 24 hours ago
-                    if yesterday_pressure is None or time_diff < abs((yesterday_time - yesterday.astimezone()).total_seconds()):
-                        yesterday_pressure = pressure_hpa
-                        yesterday_time = obs_time
-
-        if current_pressure and yesterday_pressure:
-            pressure_change = current_pressure - yesterday_pressure
-        else:
-            pressure_change = None
 
-        return {
-            'current_pressure': round(current_pressure, 1) if current_pressure else None,
-            'yesterday_pressure': round(yesterday_pressure, 1) if yesterday_pressure else None,
-            'pressure_change': round(pressure_change, 1) if pressure_change else None,
-            'current_time': current_time,
-            'yesterday_time': yesterday_time
-        }
+def parse_precipitation_data(features, times, hours=12):
+    """Summarize precipitation from NWS observation features and their parsed timestamps"""
+    cutoff_time = (datetime.now() - timedelta(hours=hours)).astimezone()
+    seven_days_ago = (datetime.now() - timedelta(days=7)).astimezone()
+
+    total_precip_mm = 0
+    observation_count = 0
+    latest_observation = None
+
+    # Dictionary to store daily totals: date -> precip_mm
+    daily_totals = defaultdict(float)
+
+    # Observations are newest-first: the recent window comes first, then the
+    # rest of the 7 days only feeds the daily totals, then the loop stops
+    for obs_time, (precip_mm, _) in zip(times, _unpack_features(features)):
+        # Stop if we've gone back more than 7 days
+        if obs_time < seven_days_ago:
+            break
+
+        if latest_observation is None:
+            latest_observation = obs_time
+
+        # Skip observations without precipitation (last hour)
+        if precip_mm is None:
+            continue
+
+        daily_totals[obs_time.date()] += precip_mm
+
+        # Within the specified hours: counts toward the recent total too
+        if obs_time >= cutoff_time:
+            total_precip_mm += precip_mm
+            observation_count += 1
+
+    # Convert mm to inches
+    total_precip_inches = total_precip_mm / 25.4
+
+    # Convert daily totals to inches as (date, inches) pairs, newest first
+    daily_totals_inches = [
+        (date, round(mm / 25.4, 2))
+        for date, mm in sorted(daily_totals.items(), reverse=True)
+    ]
+
+    return {
+        'total_mm': round(total_precip_mm, 2),
+        'total_inches': round(total_precip_inches, 2),
+        'observation_count': observation_count,
+        'latest_observation': latest_observation,
+        'daily_totals': daily_totals_inches
+    }
+
+
+def parse_pressure_data(features, times):
+    """Summarize 24-hour barometric pressure change from NWS observation features and their parsed timestamps"""
+    now = datetime.now()
+    yesterday = (now - timedelta(days=1)).astimezone()
+    # Observations older than this can no longer match the 24-hours-ago window
+    yesterday_window_start = yesterday - timedelta(hours=1)
+
+    current_pressure = None
+    yesterday_pressure = None
+    current_time = None
+    yesterday_time = None
+
+    for obs_time, (_, pressure_pa) in zip(times, _unpack_features(features)):
+        # Observations are newest-first, so once past the window nothing can change
+        if obs_time <= yesterday_window_start and current_pressure is not None:
+            break
+
+        # Get barometric pressure
+        if pressure_pa is not None:
+            # Convert Pascals to hectopascals (1 hPa = 100 Pa)
+            pressure_hpa = pressure_pa / 100
+
+            # Get most recent pressure (current)
+            if current_pressure is None:
+                current_pressure = pressure_hpa
+                current_time = obs_time
+
+            # Get pressure from approximately 24 hours ago
+            time_diff = abs((obs_time - yesterday).total_seconds())
+            if time_diff < 3600:  # Within 1 hour of 24 hours ago
+                if yesterday_pressure is None or time_diff < abs((yesterday_time - yesterday).total_seconds()):
+                    yesterday_pressure = pressure_hpa
+                    yesterday_time = obs_time
+
+    if current_pressure and yesterday_pressure:
+        pressure_change = current_pressure - yesterday_pressure
+    else:
+        pressure_change = None
 
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Error fetching pressure data: {e}")
+    return {
+        'current_pressure': round(current_pressure, 1) if current_pressure else None,
+        'yesterday_pressure': round(yesterday_pressure, 1) if yesterday_pressure else None,
+        'pressure_change': round(pressure_change, 1) if pressure_change else None,
+        'current_time': current_time,
+        'yesterday_time': yesterday_time
+    }
 
 
 @retry_nws_call()
-def get_forecast(lat, lon):
+def get_forecast(forecast_url):
     """Fetch daily forecast from NWS"""
-    points_url = f"https://api.weather.gov/points/{lat},{lon}"
-    headers = {"User-Agent": "SprinklerCheckScript/1.0"}
-
     try:
-        # Get grid endpoint for forecast
-        response = requests.get(points_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        forecast_url = data['properties']['forecast']
-
-        # Fetch forecast
-        forecast_response = requests.get(forecast_url, headers=headers, timeout=10)
+        forecast_response = SESSION.get(forecast_url, timeout=10)
         forecast_response.raise_for_status()
         forecast_data = forecast_response.json()
 
@@ -267,6 +318,49 @@ def get_forecast(lat, lon):
         raise Exception(f"Error fetching forecast: {e}")
 
 
+# Cached SMTP connection, opened on first send and reused for the rest of the process
+_smtp = None
+
+
+def _close_smtp():
+    """Close the cached SMTP connection, ignoring errors from a dead server"""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+
+
+atexit.register(_close_smtp)
+
+
+def _get_smtp(config):
+    """Return a logged-in SMTP connection, opening it on first use"""
+    global _smtp
+    if _smtp is not None:
+        # A connection kept open between scheduled runs may have been dropped
+        try:
+            alive = _smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            alive = False
+        if not alive:
+            _close_smtp()
+    if _smtp is None:
+        email_config = config['email']
+        server = smtplib.SMTP(email_config['smtp_host'], email_config['smtp_port'])
+        try:
+            server.starttls()
+            server.login(email_config['smtp_username'], email_config['smtp_password'])
+        except Exception:
+            # Don't leak the socket if the handshake or login fails
+            server.close()
+            raise
+        _smtp = server
+    return _smtp
+
+
 def send_email(config, subject, body):
     """Send email via SMTP"""
     email_config = config['email']
@@ -283,164 +377,275 @@ def send_email(config, subject, body):
     else:
         raise Exception("No recipient email configured. Use 'to_emails' (list) or 'to_email' (string) in config")
 
-    msg = MIMEMultipart()
+    msg = EmailMessage()
     msg['From'] = email_config['from_email']
     msg['To'] = ', '.join(to_emails)
     msg['Subject'] = subject
+    # The report contains non-ASCII (°, ✓/✗); keep the wire data 7-bit for servers without 8BITMIME
+    msg.set_content(body, cte='quoted-printable')
 
-    msg.attach(MIMEText(body, 'plain'))
+    # Serialize once with SMTP line endings, then reuse the bytes for every recipient
+    payload = msg.as_bytes(policy=msg.policy.clone(linesep='\r\n'))
 
     try:
-        with smtplib.SMTP(email_config['smtp_host'], email_config['smtp_port']) as server:
-            server.starttls()
-            server.login(email_config['smtp_username'], email_config['smtp_password'])
-            server.send_message(msg)
-        print(f"Email sent successfully to {len(to_emails)} recipient(s): {', '.join(to_emails)}")
+        # Deliver to each recipient separately over the same SMTP session
+        server = _get_smtp(config)
+        refused = []
+        for recipient in to_emails:
+            try:
+                server.sendmail(email_config['from_email'], [recipient], payload)
+            except smtplib.SMTPRecipientsRefused:
+                # One bad address shouldn't stop delivery to the others
+                refused.append(recipient)
     except Exception as e:
+        # Drop a possibly broken connection so the next send reconnects
+        _close_smtp()
         raise Exception(f"Error sending email: {e}")
 
+    if len(refused) == len(to_emails):
+        raise Exception(f"Error sending email: all recipients refused: {', '.join(refused)}")
 
-def main():
-    """Main script execution"""
-    try:
-        # Load configuration
-        config = load_config()
-
-        location = config['location']
-        sprinkler = config['sprinkler']
+    delivered = [r for r in to_emails if r not in refused]
+    print(f"Email sent successfully to {len(delivered)} recipient(s): {', '.join(delivered)}")
+    if refused:
+        print(f"Warning: recipient(s) refused by server: {', '.join(refused)}")
 
-        latitude = location['latitude']
-        longitude = location['longitude']
-        hours_to_check = sprinkler['hours_to_check']
-        threshold = sprinkler['threshold']
 
-        print(f"Checking precipitation for last {hours_to_check} hours...")
-        print(f"Location: {latitude}, {longitude}")
+def load_run_state():
+    """Load the saved result of the last successful run, or None if unavailable"""
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return state if isinstance(state, dict) else None
+
+
+def save_run_state(latitude, longitude, hours_to_check, station_id, total_inches):
+    """Save the result of a successful run for the next invocation"""
+    state = {
+        'last_run_ts': time.time(),
+        'latitude': latitude,
+        'longitude': longitude,
+        'hours_to_check': hours_to_check,
+        'station_id': station_id,
+        'total_inches': total_inches,
+    }
+
+    # A failed state write shouldn't fail the run
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(STATE_PATH, "w") as f:
+            json.dump(state, f)
+    except OSError as e:
+        print(f"Warning: could not save run state: {e}")
+
+
+def run_once(config):
+    """Fetch the weather data and send the report email for one run"""
+    location = config['location']
+    sprinkler = config['sprinkler']
+
+    latitude = location['latitude']
+    longitude = location['longitude']
+    hours_to_check = sprinkler['hours_to_check']
+    threshold = sprinkler['threshold']
+    # Minimum seconds between reports once the threshold has been met
+    min_interval = sprinkler.get('min_interval_s', 3600)
+
+    # Skip all fetching and email if a recent run for this location and window
+    # already found enough rain. The window moves, so rain near its old edge may
+    # since have dropped out; that staleness is accepted within min_interval_s.
+    state = load_run_state()
+    if (
+        state
+        and state.get('latitude') == latitude
+        and state.get('longitude') == longitude
+        and state.get('hours_to_check') == hours_to_check
+        and time.time() - state.get('last_run_ts', 0) < min_interval
+        and state.get('total_inches', 0) >= threshold
+    ):
+        print(f"Last run {(time.time() - state['last_run_ts']) / 60:.0f} minutes ago "
+              f"(station {state.get('station_id')}) found {state['total_inches']:.2f} inches")
+        print("Run sprinkler today? NO - Sufficient rainfall (cached, no email sent)")
+        return
+
+    print(f"Checking precipitation for last {hours_to_check} hours...")
+    print(f"Location: {latitude}, {longitude}")
+
+    # Get grid metadata once; it provides both the stations and forecast URLs
+    points = get_points(latitude, longitude)
+    stations_url = points['properties']['observationStations']
+    forecast_url = points['properties']['forecast']
+
+    # The forecast only depends on the points data, so fetch it in the
+    # background while the station and observations are looked up
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        print("Fetching forecast...")
+        forecast_future = executor.submit(get_forecast, forecast_url)
 
         # Get observation station
-        station_id = get_nws_observation_station(latitude, longitude)
+        station_id = get_nws_observation_station(stations_url)
         print(f"Using NWS station: {station_id}")
 
-        # Get precipitation data
-        precip_data = get_precipitation_data(station_id, hours_to_check)
-
-        # Get barometric pressure data
-        print("Fetching barometric pressure data...")
-        pressure_data = get_pressure_data(station_id)
-
-        # Get forecast
-        print("Fetching forecast...")
-        forecast = get_forecast(latitude, longitude)
-
-        # Determine sprinkler recommendation
-        total_precip = precip_data['total_inches']
-        if total_precip >= threshold:
-            recommendation = "NO - Sufficient rainfall"
-            emoji = "✓"
-        else:
-            recommendation = "YES - Run sprinkler"
-            emoji = "✗"
+        # Fetch observations once for both precipitation and pressure
+        features = get_observations(station_id)
 
-        # Format daily totals
-        daily_summary = []
-        for date, inches in precip_data['daily_totals'].items():
-            daily_summary.append(f"  {date.strftime('%Y-%m-%d (%a)')}: {inches:.2f} inches")
+        forecast = forecast_future.result()
 
-        daily_totals_text = "\n".join(daily_summary) if daily_summary else "  No data available"
+    # Parse observation timestamps once for both parsers
+    times = [datetime.fromisoformat(f['properties']['timestamp']) for f in features]
 
-        # Format barometric pressure information
-        # Get threshold from config, default to 6 hPa if not specified
-        pressure_threshold = sprinkler.get('pressure_change_threshold', 6)
+    # Get precipitation data
+    precip_data = parse_precipitation_data(features, times, hours_to_check)
 
-        if pressure_data['current_pressure'] and pressure_data['pressure_change'] is not None:
-            change = pressure_data['pressure_change']
-            abs_change = abs(change)
+    # Get barometric pressure data
+    pressure_data = parse_pressure_data(features, times)
 
-            # Pressure drops are more significant than pressure rises
-            if abs_change >= pressure_threshold and change < 0:
-                significance = "SIGNIFICANT"
-                trend = "falling"
-            else:
-                significance = "normal"
-                if change > 0:
-                    trend = "rising"
-                else:
-                    trend = "falling slightly"
-
-            pressure_text = f"""  Current: {pressure_data['current_pressure']:.1f} hPa
-  24h ago: {pressure_data['yesterday_pressure']:.1f} hPa
-  Change: {change:+.1f} hPa ({significance} - {trend})
-  Migraines are commonly triggered with pressures <1007 hPa or changes >6 hPa.
-  """
-        else:
-            pressure_text = "  Data unavailable"
-
-        # Format forecast
-        if forecast:
-            forecast_text = f"""{forecast['name'].upper()}:
-  Temperature: {forecast['temperature']}°{forecast['temperature_unit']}
-  Wind: {forecast['wind_speed']} {forecast['wind_direction']}
-  Conditions: {forecast['short_forecast']}
-
-  {forecast['detailed_forecast']}"""
+    # Determine sprinkler recommendation
+    total_precip = precip_data['total_inches']
+    if total_precip >= threshold:
+        recommendation = "NO - Sufficient rainfall"
+        emoji = "✓"
+    else:
+        recommendation = "YES - Run sprinkler"
+        emoji = "✗"
+
+    # Format daily totals
+    daily_summary = [
+        f"  {date.isoformat()} ({WEEKDAY[date.weekday()]}): {inches:.2f} inches"
+        for date, inches in precip_data['daily_totals']
+    ]
+
+    # Build email body as a list of lines, joined once at the end
+    parts = [
+        "Overnight Precipitation Report",
+        '=' * 50,
+        "",
+        f"Time Period: Last {hours_to_check} hours",
+        f"Location: {latitude}, {longitude}",
+        f"Weather Station: {station_id}",
+        "",
+        "PRECIPITATION TOTAL:",
+        f"  {precip_data['total_inches']:.2f} inches ({precip_data['total_mm']:.2f} mm)",
+        "",
+        "RUN SPRINKLER TODAY?",
+        f"  {emoji} {recommendation}",
+        "",
+        "BAROMETRIC PRESSURE (24-hour change):",
+    ]
+
+    # Format barometric pressure information
+    # Get threshold from config, default to 6 hPa if not specified
+    pressure_threshold = sprinkler.get('pressure_change_threshold', 6)
+
+    if pressure_data['current_pressure'] and pressure_data['pressure_change'] is not None:
+        change = pressure_data['pressure_change']
+        abs_change = abs(change)
+
+        # Pressure drops are more significant than pressure rises
+        if abs_change >= pressure_threshold and change < 0:
+            significance = "SIGNIFICANT"
+            trend = "falling"
         else:
-            forecast_text = "  Forecast unavailable"
-
-        # Build email body
-        email_body = f"""Overnight Precipitation Report
-{'=' * 50}
+            significance = "normal"
+            if change > 0:
+                trend = "rising"
+            else:
+                trend = "falling slightly"
 
-Time Period: Last {hours_to_check} hours
-Location: {latitude}, {longitude}
-Weather Station: {station_id}
+        parts.append(f"  Current: {pressure_data['current_pressure']:.1f} hPa")
+        parts.append(f"  24h ago: {pressure_data['yesterday_pressure']:.1f} hPa")
+        parts.append(f"  Change: {change:+.1f} hPa ({significance} - {trend})")
+        parts.append("  Migraines are commonly triggered with pressures <1007 hPa or changes >6 hPa.")
+    else:
+        parts.append("  Data unavailable")
+
+    # Format forecast
+    parts.append("")
+    parts.append("FORECAST:")
+    if forecast:
+        parts.append(f"{forecast['name'].upper()}:")
+        parts.append(f"  Temperature: {forecast['temperature']}°{forecast['temperature_unit']}")
+        parts.append(f"  Wind: {forecast['wind_speed']} {forecast['wind_direction']}")
+        parts.append(f"  Conditions: {forecast['short_forecast']}")
+        parts.append("")
+        parts.append(f"  {forecast['detailed_forecast']}")
+    else:
+        parts.append("  Forecast unavailable")
 
-PRECIPITATION TOTAL:
-  {precip_data['total_inches']:.2f} inches ({precip_data['total_mm']:.2f} mm)
+    parts.append("")
+    parts.append("LAST 7 DAYS (Daily Totals):")
+    parts.extend(daily_summary or ["  No data available"])
 
-RUN SPRINKLER TODAY?
-  {emoji} {recommendation}
+    parts.extend([
+        "",
+        "Details:",
+        f"  - Threshold: {threshold} inches",
+        f"  - Hours of precipitation: {precip_data['observation_count']}",
+        f"  - Latest observation: {precip_data['latest_observation']}",
+        "",
+        '=' * 50,
+        f"Generated at: {datetime.now().isoformat(sep=' ', timespec='seconds')}",
+        "",
+    ])
 
-BAROMETRIC PRESSURE (24-hour change):
-{pressure_text}
+    email_body = "\n".join(parts)
 
-FORECAST:
-{forecast_text}
+    # Print to console
+    print("\n" + email_body)
 
-LAST 7 DAYS (Daily Totals):
-{daily_totals_text}
+    # Send email
+    subject = f"Weather update!"
+    send_email(config, subject, email_body)
 
-Details:
-  - Threshold: {threshold} inches
-  - Hours of precipitation: {precip_data['observation_count']}
-  - Latest observation: {precip_data['latest_observation']}
+    save_run_state(latitude, longitude, hours_to_check, station_id, precip_data['total_inches'])
 
-{'=' * 50}
-Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
 
-        # Print to console
-        print("\n" + email_body)
+def main():
+    """Main script execution: run once, or repeatedly if [schedule] is configured"""
+    while True:
+        try:
+            # Load configuration
+            config = load_config()
+            run_once(config)
+            print("\nScript completed successfully!")
+            status = 0
 
-        # Send email
-        subject = f"Weather update!"
-        send_email(config, subject, email_body)
+        except Exception as e:
+            error_msg = f"Error: {e}"
+            print(error_msg)
 
-        print("\nScript completed successfully!")
+            # Try to send error email
+            try:
+                config = load_config()
+                send_email(config, "Weather update - ERROR", error_msg)
+            except:
+                print("Failed to send error notification email")
 
-    except Exception as e:
-        error_msg = f"Error: {e}"
-        print(error_msg)
+            status = 1
 
-        # Try to send error email
+        # Without a schedule (e.g. under cron) run once and exit; otherwise keep
+        # the process, HTTP session and SMTP connection alive between runs
         try:
-            config = load_config()
-            send_email(config, "Weather update - ERROR", error_msg)
-        except:
-            print("Failed to send error notification email")
+            interval_hours = load_config().get('schedule', {}).get('interval_hours')
+        except Exception:
+            interval_hours = None
 
-        return 1
+        if not interval_hours:
+            return status
 
-    return 0
+        try:
+            interval_hours = float(interval_hours)
+        except (TypeError, ValueError):
+            interval_hours = None
+        if not interval_hours or interval_hours < 0:
+            print("Warning: ignoring invalid [schedule] interval_hours; running once")
+            return status
+
+        print(f"Next run in {interval_hours} hours...")
+        time.sleep(interval_hours * 3600)
 
 
 if __name__ == "__main__":